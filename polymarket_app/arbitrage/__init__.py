@@ -1,6 +1,15 @@
 """Arbitrage detection and optimization."""
 
-from .single_condition import detect_single_condition_arbitrage
+from .single_condition import (
+    detect_single_condition_arbitrage,
+    detect_single_condition_arbitrage_batch,
+    market_price_arrays,
+)
 from .bregman import bregman_projection_lmsr
 
-__all__ = ["detect_single_condition_arbitrage", "bregman_projection_lmsr"]
\ No newline at end of file
+__all__ = [
+    "detect_single_condition_arbitrage",
+    "detect_single_condition_arbitrage_batch",
+    "market_price_arrays",
+    "bregman_projection_lmsr",
+]
\ No newline at end of file
@@ -6,14 +6,63 @@ is the Kullback-Leibler divergence. The projection mu* onto the
 marginal polytope M gives the arbitrage-free price vector.
 """
 
+import math
+import warnings
+
 import numpy as np
-from scipy.optimize import minimize
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to math/NumPy kernels
+    njit = None
 
-def kl_divergence(mu: np.ndarray, theta: np.ndarray, eps: float = 1e-10) -> float:
-    theta_safe = np.clip(theta, eps, 1 - eps)
+_NEWTON_MAX_ITER = 50
+_NEWTON_TOL = 1e-9
+_SMALL_N = 64  # Below this, scalar math.log beats NumPy's per-call dispatch
+
+
+def _kl_and_grad_loop(mu: np.ndarray, theta: np.ndarray, eps: float) -> tuple[float, np.ndarray]:
+    """KL(mu || theta) and its gradient w.r.t. mu in a single pass."""
+    s = 0.0
+    g = np.empty_like(mu)
+    for i in range(mu.shape[0]):
+        m = min(max(mu[i], eps), 1 - eps)
+        t = min(max(theta[i], eps), 1 - eps)
+        d = math.log(m) - math.log(t)
+        s += m * d
+        g[i] = d + 1.0
+    return s, g
+
+
+def _kl_and_grad_numpy(mu: np.ndarray, theta: np.ndarray, eps: float) -> tuple[float, np.ndarray]:
+    """Uncompiled _kl_and_grad: scalar loop on short vectors, NumPy otherwise."""
+    if mu.shape[0] < _SMALL_N:
+        s = 0.0
+        g = []
+        for m, t in zip(mu.tolist(), theta.tolist()):
+            m = min(max(m, eps), 1 - eps)
+            t = min(max(t, eps), 1 - eps)
+            d = math.log(m) - math.log(t)
+            s += m * d
+            g.append(d + 1.0)
+        return s, np.array(g)
     mu_safe = np.clip(mu, eps, 1 - eps)
-    return np.sum(mu_safe * (np.log(mu_safe) - np.log(theta_safe)))
+    d = np.log(mu_safe) - np.log(np.clip(theta, eps, 1 - eps))
+    return float(np.sum(mu_safe * d)), d + 1.0
+
+
+if njit is not None:
+    _kl_and_grad = njit(fastmath=True, cache=True)(_kl_and_grad_loop)
+    # Compile on import so the first projection doesn't pay JIT latency.
+    _kl_and_grad(np.full(2, 0.5), np.full(2, 0.5), 1e-10)
+else:
+    _kl_and_grad = _kl_and_grad_numpy
+
+
+def kl_divergence(mu: np.ndarray, theta: np.ndarray, eps: float = 1e-10) -> float:
+    mu = np.ascontiguousarray(mu, dtype=np.float64)
+    theta = np.ascontiguousarray(theta, dtype=np.float64)
+    return _kl_and_grad(mu, theta, eps)[0]
 
 
 def bregman_projection_lmsr(
@@ -23,18 +72,62 @@ def bregman_projection_lmsr(
     bounds: tuple[float, float] = (1e-6, 1 - 1e-6),
     max_iter: int = 500,
 ) -> tuple[np.ndarray, bool]:
+    """
+    Project theta onto {mu : A mu = b} under KL divergence.
+
+    Stationarity of KL(mu || theta) - lam.(A mu - b) gives
+    mu = theta * exp(A^T lam - 1), so the n-dim primal reduces to an
+    m-dim root-find on A mu(lam) = b, solved by Newton with Jacobian
+    A diag(mu) A^T. Falls back to SLSQP if Newton fails to converge.
+    """
+    theta = np.ascontiguousarray(theta, dtype=np.float64)
+    A = np.atleast_2d(np.asarray(equality_constraints, dtype=np.float64))
+    b = np.atleast_1d(np.asarray(equality_values, dtype=np.float64))
+    lo, hi = bounds
+    log_theta = np.log(np.clip(theta, 1e-10, 1 - 1e-10))
+
+    # Start where the exponent vanishes so mu begins at theta (exact when A has a sum row)
+    lam = np.linalg.lstsq(A.T, np.ones(len(theta)), rcond=None)[0]
+    with np.errstate(over="ignore"):
+        for _ in range(min(max_iter, _NEWTON_MAX_ITER)):
+            mu = np.exp(log_theta + A.T @ lam - 1.0)
+            free = (mu > lo) & (mu < hi)  # clipped coordinates have zero derivative
+            mu = np.clip(mu, lo, hi)
+            r = A @ mu - b
+            if np.linalg.norm(r) < _NEWTON_TOL:
+                return mu, True
+            J = A @ ((mu * free)[:, None] * A.T)
+            try:
+                lam = lam - np.linalg.solve(J, r)
+            except np.linalg.LinAlgError:
+                break
+            if not np.all(np.isfinite(lam)):
+                break
+    return _bregman_projection_slsqp(theta, A, b, bounds, max_iter)
+
+
+def _bregman_projection_slsqp(
+    theta: np.ndarray,
+    A: np.ndarray,
+    b: np.ndarray,
+    bounds: tuple[float, float],
+    max_iter: int,
+) -> tuple[np.ndarray, bool]:
+    """Generic SLSQP projection, used when the dual Newton iteration diverges."""
+    from scipy.optimize import minimize
+
     n = len(theta)
-    theta = np.asarray(theta, dtype=float)
 
-    def objective(mu: np.ndarray) -> float:
-        return kl_divergence(mu, theta)
+    def objective(mu: np.ndarray) -> tuple[float, np.ndarray]:
+        return _kl_and_grad(mu, theta, 1e-10)
 
-    constraints = [{"type": "eq", "fun": lambda m: equality_constraints @ m - equality_values}]
+    constraints = [{"type": "eq", "fun": lambda m: A @ m - b}]
     bnds = [(bounds[0], bounds[1]) for _ in range(n)]
     res = minimize(
         objective,
         x0=np.clip(theta, bounds[0], bounds[1]),
         method="SLSQP",
+        jac=True,
         bounds=bnds,
         constraints=constraints,
         options={"maxiter": max_iter, "ftol": 1e-9},
@@ -42,12 +135,31 @@ def bregman_projection_lmsr(
     return res.x, res.success
 
 
+def frank_wolfe_oracle_sparse(gradient: np.ndarray) -> int:
+    """
+    Linear minimization oracle over the simplex: the vertex e_i minimizing
+    <gradient, z>, returned as its index i instead of a dense one-hot vector.
+    """
+    return int(np.argmin(gradient))
+
+
+def frank_wolfe_update(x: np.ndarray, i: int, step: float) -> np.ndarray:
+    """In-place Frank-Wolfe step x <- x + step * (e_i - x) toward vertex i."""
+    x *= 1.0 - step
+    x[i] += step
+    return x
+
+
 def frank_wolfe_oracle(
     gradient: np.ndarray,
     constraint_matrix: np.ndarray,
     constraint_rhs: np.ndarray,
 ) -> np.ndarray:
-    i = np.argmin(gradient)
+    warnings.warn(
+        "frank_wolfe_oracle is deprecated; use frank_wolfe_oracle_sparse with frank_wolfe_update",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     z = np.zeros_like(gradient)
-    z[i] = 1.0
-    return z
\ No newline at end of file
+    z[frank_wolfe_oracle_sparse(gradient)] = 1.0
+    return z
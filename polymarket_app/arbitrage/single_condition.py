@@ -7,16 +7,21 @@ Layer 1: Fast check - do YES + NO prices sum to $1?
 """
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional
+from typing import Optional, Sequence
 
-if TYPE_CHECKING:
-    from ..data.models import ConditionPrices
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to NumPy masks
+    njit = None
+    prange = range
 
 from ..config import MIN_PROFIT_THRESHOLD
-from ..data.models import ConditionPrices, Market, OrderBook
+from ..data.models import BuySellPrices, Market, OrderBook
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArbitrageOpportunity:
     """Detected arbitrage opportunity."""
     market_id: str
@@ -39,32 +44,95 @@ class ArbitrageOpportunity:
         return self.profit_margin
 
     def max_extractable_usd(self, max_size: float | None = None) -> float | None:
+        """
+        Profit from filling YES and NO together down the books while each
+        additional pair still costs < $1 (buy) or pays > $1 (sell).
+        """
         if not self.order_book_yes or not self.order_book_no:
             return None
-        yes_depth = sum(s for _, s in self.order_book_yes.asks)
-        no_depth = sum(s for _, s in self.order_book_no.asks)
         if self.direction == "sell_both":
-            yes_depth = sum(s for _, s in self.order_book_yes.bids)
-            no_depth = sum(s for _, s in self.order_book_no.bids)
-        cap = min(yes_depth, no_depth)
-        if max_size is not None:
-            cap = min(cap, max_size)
-        return self.profit_margin * cap
+            side, sign = "bid", -1.0
+        else:
+            side, sign = "ask", 1.0
+        return _pair_fill_profit(
+            self.order_book_yes.fill_depth(side),
+            self.order_book_no.fill_depth(side),
+            sign,
+            max_size,
+        )
+
+
+def _pair_fill_profit(
+    yes: tuple[np.ndarray, np.ndarray],
+    no: tuple[np.ndarray, np.ndarray],
+    sign: float,
+    max_size: float | None,
+) -> float:
+    """
+    Walk two (prices, cumulative sizes) sides at once. Between consecutive
+    cumulative-size breakpoints both legs fill at a fixed price, so the edge
+    per pair is constant on each segment; sign=1 buys (1 - yes - no),
+    sign=-1 sells (yes + no - 1). Best-first books make the edge
+    non-increasing, so clipping at zero stops the walk where it turns.
+    """
+    (p_yes, cum_yes), (p_no, cum_no) = yes, no
+    if not len(cum_yes) or not len(cum_no):
+        return 0.0
+    cap = min(cum_yes[-1], cum_no[-1])
+    if max_size is not None:
+        cap = min(cap, max_size)
+    ends = np.union1d(cum_yes, cum_no)
+    ends = np.append(ends[ends < cap], cap)
+    starts = np.concatenate(([0.0], ends[:-1]))
+    pair = (
+        p_yes[np.searchsorted(cum_yes, starts, side="right")]
+        + p_no[np.searchsorted(cum_no, starts, side="right")]
+    )
+    edge = np.clip(sign * (1.0 - pair), 0.0, None)
+    return float(edge @ (ends - starts))
+
+
+def _make_opp(
+    market: Market,
+    direction: str,
+    price_yes: float,
+    price_no: float,
+    token_id_yes: str,
+    token_id_no: str,
+) -> ArbitrageOpportunity:
+    sum_prices = price_yes + price_no
+    return ArbitrageOpportunity(
+        market_id=market.id,
+        question=market.question,
+        slug=market.slug,
+        event_slug=market.event_slug,
+        end_date=getattr(market, "end_date", "") or "",
+        direction=direction,
+        price_yes=price_yes,
+        price_no=price_no,
+        sum_prices=sum_prices,
+        profit_margin=1.0 - sum_prices if direction == "buy_both" else sum_prices - 1.0,
+        token_id_yes=token_id_yes,
+        token_id_no=token_id_no,
+        order_book_yes=market.order_book_yes,
+        order_book_no=market.order_book_no,
+    )
 
 
 def detect_single_condition_arbitrage(
     market: Market,
     min_profit: float = MIN_PROFIT_THRESHOLD,
     use_order_book: bool = True,
-    clob_prices: Optional[dict[str, "ConditionPrices"]] = None,
+    clob_prices: Optional[BuySellPrices] = None,
 ) -> list[ArbitrageOpportunity]:
     if clob_prices:
-        buy_prices = clob_prices.get("buy")
-        sell_prices = clob_prices.get("sell")
+        buy_prices, sell_prices = clob_prices
     elif use_order_book:
         ob_prices = market.get_order_book_prices()
-        buy_prices = ob_prices["buy"] if ob_prices else market.get_prices()
-        sell_prices = ob_prices["sell"] if ob_prices else market.get_prices()
+        if ob_prices:
+            buy_prices, sell_prices = ob_prices
+        else:
+            buy_prices = sell_prices = market.get_prices()
     else:
         gp = market.get_prices()
         buy_prices = sell_prices = gp
@@ -72,43 +140,125 @@ def detect_single_condition_arbitrage(
     if not buy_prices or not sell_prices:
         return []
 
-    opps = []
+    # A non-crossed book can't be buy-arb and sell-arb at once, so stop at the first hit
     if buy_prices.arbitrage_down and buy_prices.profit_margin >= min_profit:
-        opps.append(
-            ArbitrageOpportunity(
-                market_id=market.id,
-                question=market.question,
-                slug=market.slug,
-                event_slug=market.event_slug,
-                end_date=getattr(market, "end_date", "") or "",
-                direction="buy_both",
-                price_yes=buy_prices.price_yes,
-                price_no=buy_prices.price_no,
-                sum_prices=buy_prices.sum_prices,
-                profit_margin=buy_prices.profit_margin,
-                token_id_yes=buy_prices.token_id_yes,
-                token_id_no=buy_prices.token_id_no,
-                order_book_yes=market.order_book_yes,
-                order_book_no=market.order_book_no,
-            )
-        )
+        return [_make_opp(market, "buy_both", buy_prices.price_yes, buy_prices.price_no,
+                          buy_prices.token_id_yes, buy_prices.token_id_no)]
     if sell_prices.arbitrage_up and sell_prices.profit_margin >= min_profit:
-        opps.append(
-            ArbitrageOpportunity(
-                market_id=market.id,
-                question=market.question,
-                slug=market.slug,
-                event_slug=market.event_slug,
-                end_date=getattr(market, "end_date", "") or "",
-                direction="sell_both",
-                price_yes=sell_prices.price_yes,
-                price_no=sell_prices.price_no,
-                sum_prices=sell_prices.sum_prices,
-                profit_margin=sell_prices.profit_margin,
-                token_id_yes=sell_prices.token_id_yes,
-                token_id_no=sell_prices.token_id_no,
-                order_book_yes=market.order_book_yes,
-                order_book_no=market.order_book_no,
-            )
+        return [_make_opp(market, "sell_both", sell_prices.price_yes, sell_prices.price_no,
+                          sell_prices.token_id_yes, sell_prices.token_id_no)]
+    return []
+
+
+def market_price_arrays(
+    markets: Sequence[Market],
+    use_order_book: bool = True,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Index-aligned (buy_yes, buy_no, sell_yes, sell_no) arrays for the batch detector.
+    Best ask/bid when both books have both sides, else Gamma prices, else NaN —
+    the same fallback as detect_single_condition_arbitrage, without building
+    ConditionPrices per market.
+    """
+    out = np.full((4, len(markets)), np.nan)
+    for i, m in enumerate(markets):
+        yes, no = m.order_book_yes, m.order_book_no
+        top = (
+            (yes.best_ask_price, no.best_ask_price, yes.best_bid_price, no.best_bid_price)
+            if use_order_book and yes and no
+            else (None,)
         )
-    return opps
\ No newline at end of file
+        if None not in top:
+            out[:, i] = top
+        elif m.is_binary:
+            py, pn = m.outcome_prices[0], m.outcome_prices[1]
+            out[:, i] = (py, pn, py, pn)
+    return out[0], out[1], out[2], out[3]
+
+
+# Direction codes returned by _score_arbitrage
+_BUY_BOTH = 1
+_SELL_BOTH = -1
+
+
+def _score_arbitrage_loop(
+    buy_yes: np.ndarray,
+    buy_no: np.ndarray,
+    sell_yes: np.ndarray,
+    sell_no: np.ndarray,
+    min_profit: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Per-market (flag, direction, profit); buy-both wins when both would hit."""
+    n = buy_yes.shape[0]
+    flag = np.zeros(n, dtype=np.int8)
+    direction = np.zeros(n, dtype=np.int8)
+    profit = np.zeros(n, dtype=np.float64)
+    for i in prange(n):
+        # NaN (missing price) fails both comparisons, so no fastmath here
+        buy_sum = buy_yes[i] + buy_no[i]
+        sell_sum = sell_yes[i] + sell_no[i]
+        if buy_sum < 1.0 and 1.0 - buy_sum >= min_profit:
+            flag[i] = 1
+            direction[i] = _BUY_BOTH
+            profit[i] = 1.0 - buy_sum
+        elif sell_sum > 1.0 and sell_sum - 1.0 >= min_profit:
+            flag[i] = 1
+            direction[i] = _SELL_BOTH
+            profit[i] = sell_sum - 1.0
+    return flag, direction, profit
+
+
+def _score_arbitrage_numpy(
+    buy_yes: np.ndarray,
+    buy_no: np.ndarray,
+    sell_yes: np.ndarray,
+    sell_no: np.ndarray,
+    min_profit: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Uncompiled _score_arbitrage using whole-array masks."""
+    buy_sum = buy_yes + buy_no
+    sell_sum = sell_yes + sell_no
+    buy_hit = (buy_sum < 1.0) & (1.0 - buy_sum >= min_profit)
+    sell_hit = ~buy_hit & (sell_sum > 1.0) & (sell_sum - 1.0 >= min_profit)
+    direction = np.where(buy_hit, _BUY_BOTH, np.where(sell_hit, _SELL_BOTH, 0)).astype(np.int8)
+    profit = np.where(buy_hit, 1.0 - buy_sum, np.where(sell_hit, sell_sum - 1.0, 0.0))
+    return (buy_hit | sell_hit).astype(np.int8), direction, profit
+
+
+if njit is not None:
+    # Compiled lazily on first batch call; cache=True keeps later processes from paying it
+    _score_arbitrage = njit(parallel=True, cache=True)(_score_arbitrage_loop)
+else:
+    _score_arbitrage = _score_arbitrage_numpy
+
+
+def detect_single_condition_arbitrage_batch(
+    markets: Sequence[Market],
+    buy_yes: np.ndarray,
+    buy_no: np.ndarray,
+    sell_yes: np.ndarray,
+    sell_no: np.ndarray,
+    min_profit: float = MIN_PROFIT_THRESHOLD,
+) -> list[ArbitrageOpportunity]:
+    """
+    Vectorized detect_single_condition_arbitrage over many markets.
+
+    Price arrays are index-aligned with markets (NaN where a price is missing).
+    The screen is one pass over the arrays; ArbitrageOpportunity objects are
+    only built for flagged markets.
+    """
+    buy_yes = np.ascontiguousarray(buy_yes, dtype=np.float64)
+    buy_no = np.ascontiguousarray(buy_no, dtype=np.float64)
+    sell_yes = np.ascontiguousarray(sell_yes, dtype=np.float64)
+    sell_no = np.ascontiguousarray(sell_no, dtype=np.float64)
+    flag, direction, _ = _score_arbitrage(buy_yes, buy_no, sell_yes, sell_no, float(min_profit))
+
+    opps = []
+    for i in np.flatnonzero(flag):
+        market = markets[i]
+        tid_yes, tid_no = market.clob_token_ids[0], market.clob_token_ids[1]
+        if direction[i] == _BUY_BOTH:
+            opps.append(_make_opp(market, "buy_both", float(buy_yes[i]), float(buy_no[i]), tid_yes, tid_no))
+        else:
+            opps.append(_make_opp(market, "sell_both", float(sell_yes[i]), float(sell_no[i]), tid_yes, tid_no))
+    return opps
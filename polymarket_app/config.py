@@ -1,9 +1,22 @@
 """Configuration and constants."""
 
+import os
+
 # Polymarket API endpoints
 GAMMA_API = "https://gamma-api.polymarket.com"
 CLOB_API = "https://clob.polymarket.com"
 CLOB_WS = "wss://ws-subscriptions-clob.polymarket.com/ws/"
+CLOB_MAX_CONCURRENCY = 10  # Concurrent CLOB REST requests per scan
+CLOB_MAX_REQUESTS_PER_SECOND = 50  # CLOB REST request rate per scan
+HTTP_MAX_CONNECTIONS = 100  # Per shared client pool
+HTTP_MAX_KEEPALIVE = 50
+
+# On-disk response cache (seconds). Books ~ one Polygon block, events change slowly.
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "polymarket_app"
+)  # Per-user, so the cache doesn't depend on (or litter) the working directory
+BOOK_CACHE_TTL = 2.0
+EVENTS_CACHE_TTL = 30.0
 
 # Arbitrage detection thresholds (from research paper)
 MIN_PROFIT_THRESHOLD = 0.03  # 3% minimum - smaller edges eaten by fees/slippage
@@ -5,6 +5,7 @@ Streamlit monitoring dashboard for Polymarket arbitrage.
 import asyncio
 from datetime import date
 import sys
+import threading
 from pathlib import Path
 
 # Allow running as script: streamlit run polymarket_app/dashboard.py
@@ -12,21 +13,50 @@ _root = Path(__file__).resolve().parent.parent
 if str(_root) not in sys.path:
     sys.path.insert(0, str(_root))
 
+import numpy as np
 import streamlit as st
 
-from polymarket_app.config import MIN_PROFIT_THRESHOLD
-from polymarket_app.data import GammaClient, ClobClient
-from polymarket_app.arbitrage import detect_single_condition_arbitrage
+from polymarket_app.config import CLOB_MAX_CONCURRENCY, MIN_PROFIT_THRESHOLD
+from polymarket_app.data import GammaClient, ClobClient, ClobWS, Market
+from polymarket_app.arbitrage import detect_single_condition_arbitrage_batch, market_price_arrays
+
+
+@st.cache_resource
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """Background event loop kept alive across reruns, so HTTP connection pools survive."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
+@st.cache_resource
+def _book_stream() -> ClobWS:
+    """Order-book WebSocket kept open across reruns; runs on _event_loop()."""
+    return ClobWS()
 
 
 def run_async(coro):
     """Run async code in Streamlit."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(coro)
-    finally:
-        loop.close()
+    return asyncio.run_coroutine_threadsafe(coro, _event_loop()).result()
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _load_markets(limit: int, end_date_min: str | None, end_date_max: str | None) -> list[Market]:
+    """Active markets from Gamma, memoized across reruns with the same filters."""
+    return run_async(
+        GammaClient.instance().fetch_active_markets(
+            limit=limit,
+            end_date_min=end_date_min,
+            end_date_max=end_date_max,
+        )
+    )
+
+
+def _fmt_col(rows, attr: str, fmt: str, scale: float = 1.0):
+    """One numeric opportunity attribute as a formatted string column."""
+    import pandas as pd
+    values = np.fromiter((getattr(o, attr) for o in rows), dtype=float, count=len(rows))
+    return pd.Series(values * scale).map(fmt.format)
 
 
 def main() -> None:
@@ -62,8 +92,8 @@ def main() -> None:
 
     if st.button("Run Scan", type="primary"):
         with st.spinner("Fetching markets and order books..."):
-            gamma = GammaClient()
-            clob = ClobClient()
+            clob = ClobClient.instance()
+            ws = _book_stream()
 
             async def fetch_ob(tid):
                 try:
@@ -71,62 +101,55 @@ def main() -> None:
                 except Exception:
                     return None
 
-            async def scan():
-                markets = await gamma.fetch_active_markets(
-                    limit=limit,
-                    end_date_min=end_date_min,
-                    end_date_max=end_date_max,
-                )
-                binary = [
-                    m
-                    for m in markets
-                    if len(m.clob_token_ids) >= 2
-                    and m.clob_token_ids[0]
-                    and m.clob_token_ids[1]
-                ]
-                sem = asyncio.Semaphore(10)
+            async def scan(markets):
+                binary = [m for m in markets if m.is_binary]
+                sem = asyncio.Semaphore(CLOB_MAX_CONCURRENCY)
                 async def bf(tid):
                     async with sem:
                         return await fetch_ob(tid)
-                for m in binary:
-                    obs = await asyncio.gather(
-                        bf(m.clob_token_ids[0]),
-                        bf(m.clob_token_ids[1]),
-                    )
-                    m.order_book_yes, m.order_book_no = obs[0], obs[1]
-                opps = []
-                opps_any = []
-                sum_prices_list = []
-                use_ob = price_source == "Order book"
-                use_clob_price = price_source == "CLOB price API"
-                for m in binary:
-                    clob_prices = None
-                    if use_clob_price:
-                        clob_prices = await clob.get_clob_prices(
+                async def book_for(tid):
+                    book = ws.snapshot(tid)
+                    return book if book is not None else await bf(tid)
+                async def bp(m):
+                    async with sem:
+                        return await clob.get_clob_prices(
                             m.clob_token_ids[0],
                             m.clob_token_ids[1],
                             m.outcomes,
                         )
+                # Books stream in over the long-lived WebSocket; tokens without a
+                # snapshot yet go straight to REST rather than waiting for one.
+                # One gather across all markets so the semaphore stays saturated.
+                tids = [tid for m in binary for tid in m.clob_token_ids[:2]]
+                await ws.start(tids)
+                obs = await asyncio.gather(*(book_for(tid) for tid in tids))
+                for m, ob_yes, ob_no in zip(binary, obs[0::2], obs[1::2]):
+                    m.order_book_yes, m.order_book_no = ob_yes, ob_no
+                use_ob = price_source == "Order book"
+                if price_source == "CLOB price API":
+                    all_clob_prices = await asyncio.gather(*(bp(m) for m in binary))
+                    # Markets without CLOB prices fall back to Gamma
+                    buy_yes, buy_no, sell_yes, sell_no = market_price_arrays(binary, use_order_book=False)
+                    sum_prices_list = []
+                    for i, clob_prices in enumerate(all_clob_prices):
                         if clob_prices:
-                            sum_prices_list.append(clob_prices["buy"].sum_prices)
-                            sum_prices_list.append(clob_prices["sell"].sum_prices)
-                    elif use_ob:
-                        ob_prices = m.get_order_book_prices()
-                        if ob_prices:
-                            sum_prices_list.extend([ob_prices["buy"].sum_prices, ob_prices["sell"].sum_prices])
-                        else:
-                            gp = m.get_prices()
-                            if gp:
-                                sum_prices_list.append(gp.sum_prices)
-                    else:
-                        gp = m.get_prices()
-                        if gp:
-                            sum_prices_list.append(gp.sum_prices)
-                    opps.extend(detect_single_condition_arbitrage(m, min_profit=min_profit, use_order_book=use_ob, clob_prices=clob_prices))
-                    opps_any.extend(detect_single_condition_arbitrage(m, min_profit=0.0, use_order_book=use_ob, clob_prices=clob_prices))
+                            buy, sell = clob_prices
+                            buy_yes[i], buy_no[i] = buy.price_yes, buy.price_no
+                            sell_yes[i], sell_no[i] = sell.price_yes, sell.price_no
+                            sum_prices_list.extend([buy.sum_prices, sell.sum_prices])
+                else:
+                    buy_yes, buy_no, sell_yes, sell_no = market_price_arrays(binary, use_order_book=use_ob)
+                    buy_sum = buy_yes + buy_no
+                    sell_sum = sell_yes + sell_no
+                    # Gamma rows price both sides alike; count those once
+                    sums = np.concatenate([buy_sum, sell_sum[sell_sum != buy_sum]])
+                    sum_prices_list = sums[np.isfinite(sums)].tolist()
+                opps_any = detect_single_condition_arbitrage_batch(binary, buy_yes, buy_no, sell_yes, sell_no, min_profit=0.0)
+                opps = [o for o in opps_any if o.profit_margin >= min_profit]
                 return opps, opps_any, len(binary), sum_prices_list
 
-            opps, opps_any, n_markets, sum_prices_list = run_async(scan())
+            markets = _load_markets(limit, end_date_min, end_date_max)
+            opps, opps_any, n_markets, sum_prices_list = run_async(scan(markets))
 
         st.success(f"Scanned {n_markets} markets. Found {len(opps)} opportunities.")
         if opps:
@@ -147,22 +170,19 @@ def main() -> None:
                 except Exception:
                     return "—"
 
-            df = pd.DataFrame(
-                [
-                    {
-                        "Question": o.question[:60] + "..." if len(o.question) > 60 else o.question,
-                        "Direction": o.direction,
-                        "Resolution": _res_date(o),
-                        "YES": f"{o.price_yes:.3f}",
-                        "NO": f"{o.price_no:.3f}",
-                        "Sum": f"{o.sum_prices:.3f}",
-                        "Profit %": f"{o.profit_margin*100:.2f}%",
-                        "Max USD": f"${o.max_extractable_usd():.2f}" if o.max_extractable_usd() else "—",
-                        "Link": _market_url(o),
-                    }
-                    for o in opps[:50]
-                ]
-            )
+            rows = opps[:50]
+            max_usd = [o.max_extractable_usd() for o in rows]
+            df = pd.DataFrame({
+                "Question": [q[:60] + "..." if len(q) > 60 else q for q in (o.question for o in rows)],
+                "Direction": [o.direction for o in rows],
+                "Resolution": [_res_date(o) for o in rows],
+                "YES": _fmt_col(rows, "price_yes", "{:.3f}"),
+                "NO": _fmt_col(rows, "price_no", "{:.3f}"),
+                "Sum": _fmt_col(rows, "sum_prices", "{:.3f}"),
+                "Profit %": _fmt_col(rows, "profit_margin", "{:.2f}%", scale=100),
+                "Max USD": [f"${v:.2f}" if v else "—" for v in max_usd],
+                "Link": [_market_url(o) for o in rows],
+            })
             st.dataframe(
                 df,
                 use_container_width=True,
@@ -181,16 +201,16 @@ def main() -> None:
                     if es:
                         return f"https://polymarket.com/event/{es}/{ms}" if ms and ms != es else f"https://polymarket.com/event/{es}"
                     return f"https://polymarket.com/event/{ms}" if ms else ""
-                df_any = pd.DataFrame([
-                    {
-                        "Question": o.question[:50] + "..." if len(o.question) > 53 else o.question,
-                        "Dir": o.direction,
-                        "YES": f"{o.price_yes:.3f}", "NO": f"{o.price_no:.3f}",
-                        "Sum": f"{o.sum_prices:.3f}", "Profit%": f"{o.profit_margin*100:.2f}%",
-                        "Link": _url(o),
-                    }
-                    for o in opps_any[:15]
-                ])
+                rows_any = opps_any[:15]
+                df_any = pd.DataFrame({
+                    "Question": [q[:50] + "..." if len(q) > 53 else q for q in (o.question for o in rows_any)],
+                    "Dir": [o.direction for o in rows_any],
+                    "YES": _fmt_col(rows_any, "price_yes", "{:.3f}"),
+                    "NO": _fmt_col(rows_any, "price_no", "{:.3f}"),
+                    "Sum": _fmt_col(rows_any, "sum_prices", "{:.3f}"),
+                    "Profit%": _fmt_col(rows_any, "profit_margin", "{:.2f}%", scale=100),
+                    "Link": [_url(o) for o in rows_any],
+                })
                 st.dataframe(df_any, use_container_width=True, hide_index=True, column_config={"Link": st.column_config.LinkColumn("Trade", display_text="Open")})
             if sum_prices_list:
                 import pandas as pd
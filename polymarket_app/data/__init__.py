@@ -1,7 +1,7 @@
 """Data pipeline - Gamma API, CLOB, WebSocket."""
 
 from .gamma import GammaClient
-from .clob import ClobClient
-from .models import Market, OrderBook, ConditionPrices
+from .clob import ClobClient, ClobWS
+from .models import BuySellPrices, Market, OrderBook, ConditionPrices
 
-__all__ = ["GammaClient", "ClobClient", "Market", "OrderBook", "ConditionPrices"]
+__all__ = ["GammaClient", "ClobClient", "ClobWS", "Market", "OrderBook", "ConditionPrices", "BuySellPrices"]
@@ -0,0 +1,61 @@
+"""On-disk TTL cache for raw API payloads."""
+
+import asyncio
+import functools
+import hashlib
+import json
+import threading
+from typing import Any, Callable
+
+from ..config import CACHE_DIR
+
+_cache = None
+_cache_lock = threading.Lock()  # First use may race between worker threads
+_MISS = object()
+
+
+def _get_cache():
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from diskcache import Cache
+                _cache = Cache(CACHE_DIR)
+    return _cache
+
+
+def _cache_get(k: str) -> Any:
+    return _get_cache().get(k, default=_MISS)
+
+
+def endpoint_key(url: str, params: dict[str, Any]) -> str:
+    """Stable cache key for a GET endpoint + query params."""
+    blob = json.dumps([url, sorted(params.items())], default=str)
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+def ttl_cache(
+    key: Callable[..., str],
+    ttl: float,
+    skip: Callable[[Any], bool] = lambda value: False,
+):
+    """
+    Cache an async function's (JSON) return value on disk for ttl seconds.
+    key builds the cache key from the call arguments; values for which
+    skip(value) is true are returned but not stored. The SQLite-backed
+    reads and writes run in a worker thread so concurrent fetches don't
+    block the event loop.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            k = key(*args, **kwargs)
+            hit = await asyncio.to_thread(_cache_get, k)
+            if hit is not _MISS:
+                return hit
+            value = await fn(*args, **kwargs)
+            if not skip(value):
+                await asyncio.to_thread(_get_cache().set, k, value, expire=ttl)
+            return value
+        return wrapper
+    return decorator
@@ -1,52 +1,128 @@
 """CLOB API client for order books and prices."""
 
-import httpx
-from .models import OrderBook, ConditionPrices
+import asyncio
+import bisect
+import json
 
+import numpy as np
+import websockets
 
-class ClobClient:
+from ..config import BOOK_CACHE_TTL, CLOB_WS
+from .cache import endpoint_key, ttl_cache
+from .http import PooledClient, json_loads
+from .models import LEVEL_DTYPE, BuySellPrices, OrderBook, ConditionPrices
+
+
+def parse_levels(levels: list) -> np.ndarray:
+    """Parse CLOB price levels (dicts or [price, size] pairs) into a LEVEL_DTYPE array."""
+    if not levels:
+        return np.empty(0, dtype=LEVEL_DTYPE)
+    # Payloads are homogeneous, so detect the level shape once
+    if isinstance(levels[0], dict):
+        pairs = ((float(L.get("price", 0)), float(L.get("size", L.get("volume", 0)))) for L in levels)
+    else:
+        pairs = ((float(L[0]), float(L[1])) for L in levels)
+    arr = np.fromiter(pairs, dtype=LEVEL_DTYPE, count=len(levels))
+    return arr[(arr["price"] > 0) & (arr["size"] > 0)]
+
+
+class _SortedLevels:
+    """One side of a streamed book: price -> size, with prices kept sorted via bisect."""
+
+    __slots__ = ("prices", "sizes")
+
+    def __init__(self, levels: np.ndarray):
+        self.sizes: dict[float, float] = dict(zip(levels["price"].tolist(), levels["size"].tolist()))
+        self.prices: list[float] = sorted(self.sizes)
+
+    def set(self, price: float, size: float) -> None:
+        if size > 0:
+            if price not in self.sizes:
+                bisect.insort(self.prices, price)
+            self.sizes[price] = size
+        elif self.sizes.pop(price, None) is not None:
+            del self.prices[bisect.bisect_left(self.prices, price)]
+
+    def ascending(self) -> list[tuple[float, float]]:
+        return [(p, self.sizes[p]) for p in self.prices]
+
+    def descending(self) -> list[tuple[float, float]]:
+        return [(p, self.sizes[p]) for p in reversed(self.prices)]
+
+
+class ClobClient(PooledClient):
     """Client for Polymarket CLOB - order books, prices, orders."""
 
     def __init__(self, base_url: str = "https://clob.polymarket.com"):
-        self.base_url = base_url.rstrip("/")
+        super().__init__(base_url)
 
     async def get_price(self, token_id: str, side: str = "buy", timeout: float = 10.0) -> float | None:
         """Get current price for a token. Returns None on 404 or error."""
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                r = await client.get(
-                    f"{self.base_url}/price",
-                    params={"token_id": token_id, "side": side},
-                )
-                r.raise_for_status()
-                data = r.json()
-                p = data.get("price")
-                return float(p) if p is not None else None
+            client = await self._get_client()
+            r = await client.get(
+                f"{self.base_url}/price",
+                params={"token_id": token_id, "side": side},
+                timeout=timeout,
+            )
+            r.raise_for_status()
+            data = json_loads(r.content)
+            p = data.get("price")
+            return float(p) if p is not None else None
         except Exception:
             return None
 
-    async def get_order_book(self, token_id: str, timeout: float = 10.0) -> OrderBook | None:
-        """Get order book for a token. Raises on HTTP error."""
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.get(
-                f"{self.base_url}/book",
-                params={"token_id": token_id},
-            )
+    async def get_prices_batch(
+        self,
+        params: list[dict],
+        timeout: float = 10.0,
+    ) -> dict[str, dict[str, float]]:
+        """
+        Get prices for many tokens in one POST /prices round trip.
+        params: [{"token_id": ..., "side": "BUY" | "SELL"}, ...]
+        Returns {token_id: {side: price}}, or {} on error. Prices that don't
+        parse are left out.
+        """
+        try:
+            client = await self._get_client()
+            r = await client.post(f"{self.base_url}/prices", json=params, timeout=timeout)
             r.raise_for_status()
-            data = r.json()
-
-        def parse_levels(levels: list) -> list[tuple[float, float]]:
-            out = []
-            for L in levels or []:
-                if isinstance(L, dict):
-                    price = float(L.get("price", 0))
-                    size = float(L.get("size", L.get("volume", 0)))
-                else:
-                    price, size = float(L[0]), float(L[1])
-                if price > 0 and size > 0:
-                    out.append((price, size))
-            return out
+            data = json_loads(r.content)
+        except Exception:
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        out: dict[str, dict[str, float]] = {}
+        for tid, sides in data.items():
+            if not isinstance(sides, dict):
+                continue
+            prices = out[tid] = {}
+            for side, p in sides.items():
+                try:
+                    prices[side] = float(p)
+                except (TypeError, ValueError):
+                    continue
+        return out
 
+    @ttl_cache(
+        key=lambda self, token_id, timeout=10.0: endpoint_key(f"{self.base_url}/book", {"token_id": token_id}),
+        ttl=BOOK_CACHE_TTL,
+        skip=lambda data: not isinstance(data, dict) or bool(data.get("error")),
+    )
+    async def _get_book_payload(self, token_id: str, timeout: float = 10.0) -> dict:
+        """Raw /book JSON for a token (cached briefly on disk)."""
+        client = await self._get_client()
+        r = await client.get(
+            f"{self.base_url}/book",
+            params={"token_id": token_id},
+            timeout=timeout,
+        )
+        r.raise_for_status()
+        return json_loads(r.content)
+
+    async def get_order_book(self, token_id: str, timeout: float = 10.0) -> OrderBook | None:
+        """Get order book for a token. Raises on HTTP error."""
+        data = await self._get_book_payload(token_id, timeout)
         if data.get("error"):
             return None
         bids = parse_levels(data.get("bids", []))
@@ -65,21 +141,23 @@ class ClobClient:
         token_id_yes: str,
         token_id_no: str,
         outcomes: list[str] | None = None,
-    ) -> dict[str, ConditionPrices] | None:
+    ) -> BuySellPrices | None:
         """
         Get buy/sell prices from CLOB /price endpoint (works for more tokens than /book).
-        Returns {"buy": ConditionPrices, "sell": ConditionPrices} or None.
+        Returns BuySellPrices or None.
         """
-        buy_yes = await self.get_price(token_id_yes, side="buy")
-        buy_no = await self.get_price(token_id_no, side="buy")
-        sell_yes = await self.get_price(token_id_yes, side="sell")
-        sell_no = await self.get_price(token_id_no, side="sell")
+        buy_yes, buy_no, sell_yes, sell_no = await asyncio.gather(
+            self.get_price(token_id_yes, side="buy"),
+            self.get_price(token_id_no, side="buy"),
+            self.get_price(token_id_yes, side="sell"),
+            self.get_price(token_id_no, side="sell"),
+        )
         if buy_yes is None or buy_no is None or sell_yes is None or sell_no is None:
             return None
         o_yes = (outcomes or ["Yes", "No"])[0]
         o_no = (outcomes or ["Yes", "No"])[1] if len(outcomes or []) > 1 else "No"
-        return {
-            "buy": ConditionPrices(
+        return BuySellPrices(
+            buy=ConditionPrices(
                 token_id_yes=token_id_yes,
                 token_id_no=token_id_no,
                 price_yes=buy_yes,
@@ -87,7 +165,7 @@ class ClobClient:
                 outcome_yes=o_yes,
                 outcome_no=o_no,
             ),
-            "sell": ConditionPrices(
+            sell=ConditionPrices(
                 token_id_yes=token_id_yes,
                 token_id_no=token_id_no,
                 price_yes=sell_yes,
@@ -95,4 +173,116 @@ class ClobClient:
                 outcome_yes=o_yes,
                 outcome_no=o_no,
             ),
-        }
+        )
+
+
+class ClobWS:
+    """
+    Order books streamed from the CLOB market WebSocket channel.
+
+    Meant to be long-lived: start() can be called repeatedly to add token IDs
+    to the running subscription. Applies "book" snapshots and "price_change"
+    diffs to in-memory levels and serves OrderBook snapshots without any REST
+    polling. Reconnects (resubscribing to every token) on error, discarding
+    the books held so far since diffs sent while disconnected are lost.
+    """
+
+    def __init__(self, url: str = CLOB_WS):
+        self.url = url.rstrip("/") + "/market"
+        self.books: dict[str, OrderBook] = {}
+        self._levels: dict[str, tuple[_SortedLevels, _SortedLevels]] = {}
+        self._asset_ids: dict[str, None] = {}  # Ordered set of subscribed tokens
+        self._ws = None
+        self._task: asyncio.Task | None = None
+
+    async def start(self, asset_ids: list[str]) -> None:
+        """Subscribe to any new asset_ids, starting the background stream if needed."""
+        new = [tid for tid in dict.fromkeys(asset_ids) if tid not in self._asset_ids]
+        self._asset_ids.update(dict.fromkeys(new))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        elif new and self._ws is not None:
+            try:
+                await self._ws.send(json.dumps({"assets_ids": new, "operation": "subscribe"}))
+            except Exception:
+                pass  # Connection dropping; _run resubscribes to everything on reconnect
+
+    def snapshot(self, token_id: str) -> OrderBook | None:
+        """Current order book for a token, or None if there is no live snapshot for it."""
+        book = self.books.get(token_id)
+        if book is None:
+            levels = self._levels.get(token_id)
+            if levels is None:
+                return None
+            bids, asks = levels
+            book = OrderBook(asset_id=token_id, bids=bids.descending(), asks=asks.ascending())
+            self.books[token_id] = book
+        return book
+
+    async def aclose(self) -> None:
+        """Stop streaming."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with websockets.connect(self.url) as ws:
+                    # Publish the socket first so start() calls made during the
+                    # initial send still subscribe their tokens
+                    self._ws = ws
+                    await ws.send(json.dumps({"assets_ids": list(self._asset_ids), "type": "market"}))
+                    async for raw in ws:
+                        self._on_message(raw)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                pass  # Dropped or unreachable; back off and resubscribe below
+            finally:
+                # Without the stream, diffs are being missed; drop the books so
+                # callers fall back to /book until fresh snapshots arrive
+                self._ws = None
+                self._levels.clear()
+                self.books.clear()
+            await asyncio.sleep(1.0)
+
+    def _on_message(self, raw: str | bytes) -> None:
+        try:
+            msg = json_loads(raw)
+        except ValueError:
+            return  # e.g. "PONG"
+        for event in msg if isinstance(msg, list) else [msg]:
+            if not isinstance(event, dict):
+                continue
+            kind = event.get("event_type")
+            if kind == "book":
+                tid = event.get("asset_id")
+                try:
+                    levels = (
+                        _SortedLevels(parse_levels(event.get("bids") or event.get("buys"))),
+                        _SortedLevels(parse_levels(event.get("asks") or event.get("sells"))),
+                    )
+                except (KeyError, IndexError, TypeError, ValueError):
+                    continue  # Malformed snapshot; skip it rather than drop the stream
+                self._levels[tid] = levels
+                self.books.pop(tid, None)
+            elif kind == "price_change":
+                for change in event.get("price_changes") or event.get("changes") or []:
+                    if not isinstance(change, dict):
+                        continue
+                    tid = change.get("asset_id") or event.get("asset_id")
+                    levels = self._levels.get(tid)
+                    if levels is None:
+                        continue  # no snapshot yet; diffs are meaningless
+                    try:
+                        price, size = float(change["price"]), float(change["size"])
+                    except (KeyError, TypeError, ValueError):
+                        continue  # Malformed diff; skip it rather than drop the stream
+                    side = levels[0] if str(change.get("side", "")).upper() == "BUY" else levels[1]
+                    side.set(price, size)
+                    self.books.pop(tid, None)
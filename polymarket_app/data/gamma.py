@@ -1,28 +1,31 @@
 """Gamma API client for Polymarket market discovery."""
 
-import json
+import asyncio
+
 import httpx
 from typing import Any
 
-from ..config import GAMMA_API
+from ..config import EVENTS_CACHE_TTL, GAMMA_API
+from .cache import endpoint_key, ttl_cache
+from .http import PooledClient, json_loads
 from .models import Market
 
 
 def _parse_json_field(val: Any) -> Any:
     """Parse JSON string fields from Gamma API (e.g. outcomes, outcomePrices)."""
-    if isinstance(val, str):
+    if isinstance(val, str) and val[:1] in ("[", "{"):
         try:
-            return json.loads(val)
-        except json.JSONDecodeError:
+            return json_loads(val)
+        except ValueError:
             return val
     return val
 
 
-class GammaClient:
+class GammaClient(PooledClient):
     """Client for Polymarket Gamma API - market discovery and metadata."""
 
     def __init__(self, base_url: str = GAMMA_API):
-        self.base_url = base_url.rstrip("/")
+        super().__init__(base_url)
 
     async def get_events(
         self,
@@ -49,11 +52,19 @@ class GammaClient:
             params["end_date_min"] = end_date_min
         if end_date_max:
             params["end_date_max"] = end_date_max
+        return await self._get_events_payload(params)
+
+    @ttl_cache(
+        key=lambda self, params: endpoint_key(f"{self.base_url}/events", params),
+        ttl=EVENTS_CACHE_TTL,
+    )
+    async def _get_events_payload(self, params: dict[str, Any]) -> list[dict]:
+        """Raw /events JSON for a query (cached on disk)."""
         timeout = httpx.Timeout(60.0)  # Gamma can be slow with large payloads
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.get(f"{self.base_url}/events", params=params)
-            r.raise_for_status()
-            return r.json()
+        client = await self._get_client()
+        r = await client.get(f"{self.base_url}/events", params=params, timeout=timeout)
+        r.raise_for_status()
+        return json_loads(r.content)
 
     async def get_markets(
         self,
@@ -71,11 +82,11 @@ class GammaClient:
         if slug:
             params["slug"] = slug
         timeout = httpx.Timeout(60.0)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            r = await client.get(f"{self.base_url}/markets", params=params)
-            r.raise_for_status()
-            data = r.json()
-            return data if isinstance(data, list) else [data]
+        client = await self._get_client()
+        r = await client.get(f"{self.base_url}/markets", params=params, timeout=timeout)
+        r.raise_for_status()
+        data = json_loads(r.content)
+        return data if isinstance(data, list) else [data]
 
     def _event_to_markets(self, event: dict) -> list[Market]:
         """Convert event payload to Market objects."""
@@ -128,7 +139,9 @@ class GammaClient:
             end_date_min=end_date_min,
             end_date_max=end_date_max,
         )
-        markets: list[Market] = []
-        for e in events:
-            markets.extend(self._event_to_markets(e))
-        return markets
+        # Field re-parsing is CPU work; keep it off the event loop so concurrent I/O isn't stalled
+        return await asyncio.to_thread(self._events_to_markets, events)
+
+    def _events_to_markets(self, events: list[dict]) -> list[Market]:
+        """Flatten event payloads into Market objects."""
+        return [m for e in events for m in self._event_to_markets(e)]
@@ -0,0 +1,71 @@
+"""Shared HTTP plumbing for the Gamma and CLOB clients."""
+
+import asyncio
+import warnings
+from typing import ClassVar, TypeVar
+
+import httpx
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json parses the same payloads, just slower
+    from json import loads as json_loads
+
+from ..config import HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE
+
+__all__ = ["PooledClient", "json_loads"]
+
+_C = TypeVar("_C", bound="PooledClient")
+
+
+class PooledClient:
+    """Base for API clients that share one pooled HTTP/2 connection pool."""
+
+    _instance: ClassVar["PooledClient | None"] = None
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @classmethod
+    def instance(cls: type[_C]) -> _C:
+        """Process-wide shared client, so its connection pool outlives a single scan."""
+        # Look in the subclass's own namespace so each client type gets its own instance
+        inst = cls.__dict__.get("_instance")
+        if inst is None:
+            inst = cls._instance = cls()
+        return inst
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Pooled HTTP/2 client, created on first use and reused across requests."""
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            # Connections are bound to the loop that opened them and must be closed there
+            if not self._loop.is_closed():
+                raise RuntimeError(
+                    f"{type(self).__name__} is open on another event loop; aclose() it there first"
+                )
+            warnings.warn(
+                f"{type(self).__name__} was not closed before its event loop ended",
+                ResourceWarning,
+                stacklevel=2,
+            )
+            self._client = None
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                ),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._loop = None
@@ -1,10 +1,13 @@
 """Data models for Polymarket markets and order books."""
 
 from dataclasses import dataclass, field
-from typing import Optional
+from operator import itemgetter
+from typing import NamedTuple, Optional
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ConditionPrices:
     """Prices for YES/NO conditions in a binary market."""
     token_id_yes: str
@@ -13,11 +16,14 @@ class ConditionPrices:
     price_no: float
     outcome_yes: str = "Yes"
     outcome_no: str = "No"
+    sum_prices: float = field(init=False)  # YES + NO; should equal 1.0 for arbitrage-free pricing
+    profit_margin: float = field(init=False)  # Max of buy-arb and sell-arb profit per $1
 
-    @property
-    def sum_prices(self) -> float:
-        """YES + NO should equal 1.0 for arbitrage-free pricing."""
-        return self.price_yes + self.price_no
+    def __post_init__(self) -> None:
+        # Frozen: derived fields are set through object.__setattr__
+        s = self.price_yes + self.price_no
+        object.__setattr__(self, "sum_prices", s)
+        object.__setattr__(self, "profit_margin", abs(s - 1.0))
 
     @property
     def arbitrage_up(self) -> bool:
@@ -29,59 +35,134 @@ class ConditionPrices:
         """Can buy both for < $1 (guaranteed profit)."""
         return self.sum_prices < 1.0
 
-    @property
-    def profit_margin(self) -> float:
-        """Max of buy-arb and sell-arb profit per $1."""
-        if self.arbitrage_up:
-            return self.sum_prices - 1.0
-        if self.arbitrage_down:
-            return 1.0 - self.sum_prices
+
+class BuySellPrices(NamedTuple):
+    """Tradeable prices for a binary market: buy at the asks, sell at the bids."""
+    buy: ConditionPrices
+    sell: ConditionPrices
+
+
+LEVEL_DTYPE = np.dtype([("price", np.float64), ("size", np.float64)])
+
+# (price, size) levels: a list of tuples or a LEVEL_DTYPE structured array
+Levels = list[tuple[float, float]] | np.ndarray
+
+
+def _sort_levels(levels: Levels, descending: bool) -> Levels:
+    """
+    Levels ordered best price first.
+
+    The CLOB /book endpoint sends each side worst-first (bids ascending, asks
+    descending), so ordered and reverse-ordered arrays are detected in one pass
+    and returned as-is or reversed instead of re-sorted. Lists go through
+    sorted(), whose run detection is already linear on ordered input.
+    """
+    if isinstance(levels, np.ndarray) and levels.dtype.names:
+        prices = levels["price"]
+        step = np.diff(prices)
+        if descending:
+            step = -step
+        if (step >= 0).all():
+            return levels
+        if (step <= 0).all():
+            return levels[::-1]
+        return levels[np.argsort(-prices if descending else prices, kind="stable")]
+    return sorted(levels, key=itemgetter(0), reverse=descending)
+
+
+def _level_arrays(levels: Levels) -> tuple[np.ndarray, np.ndarray]:
+    """Split (price, size) levels into price and size arrays."""
+    if isinstance(levels, np.ndarray) and levels.dtype.names:
+        return levels["price"], levels["size"]
+    arr = np.asarray(levels, dtype=np.float64).reshape(-1, 2)
+    return arr[:, 0], arr[:, 1]
+
+
+def _cumulative(prices: np.ndarray, sizes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Running (size, cost) totals over best-first levels."""
+    return np.cumsum(sizes), np.cumsum(prices * sizes)
+
+
+def _vwap(
+    prices: np.ndarray,
+    cum_sizes: np.ndarray,
+    cum_costs: np.ndarray,
+    size: float,
+) -> Optional[float]:
+    """Average fill price walking best-first levels; None if the book is too thin."""
+    if size <= 0:
         return 0.0
+    if not len(cum_sizes) or cum_sizes[-1] < size:
+        return None  # Insufficient liquidity
+    k = int(np.searchsorted(cum_sizes, size, side="left"))  # Level holding the last share
+    if k == 0:
+        return float(prices[0])
+    cost = cum_costs[k - 1] + prices[k] * (size - cum_sizes[k - 1])
+    return float(cost / size)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class OrderBook:
-    """Order book for a single token."""
+    """Order book for a single token. Compared by identity, since levels may be NumPy arrays."""
     asset_id: str
-    bids: list[tuple[float, float]]  # (price, size)
-    asks: list[tuple[float, float]]
+    bids: Levels  # (price, size), stored best first: bids descending, asks ascending
+    asks: Levels
+    best_bid_price: Optional[float] = field(init=False)  # Top of book, None if the side is empty
+    best_ask_price: Optional[float] = field(init=False)
+    bid_depth: float = field(init=False)  # Total size across all bid levels
+    ask_depth: float = field(init=False)
+    # Array views of the levels, in the same best-first order
+    bid_prices: np.ndarray = field(init=False, repr=False, compare=False)
+    bid_sizes: np.ndarray = field(init=False, repr=False, compare=False)
+    ask_prices: np.ndarray = field(init=False, repr=False, compare=False)
+    ask_sizes: np.ndarray = field(init=False, repr=False, compare=False)
+    # (cumulative sizes, cumulative costs) per side, built on the first VWAP/budget
+    # query so books that are screened out never pay for them
+    _bid_cum: Optional[tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)
+    _ask_cum: Optional[tuple[np.ndarray, np.ndarray]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.bids = _sort_levels(self.bids, descending=True)
+        self.asks = _sort_levels(self.asks, descending=False)
+        self.bid_prices, self.bid_sizes = _level_arrays(self.bids)
+        self.ask_prices, self.ask_sizes = _level_arrays(self.asks)
+        self.best_bid_price = float(self.bid_prices[0]) if len(self.bid_prices) else None
+        self.best_ask_price = float(self.ask_prices[0]) if len(self.ask_prices) else None
+        self.bid_depth = float(self.bid_sizes.sum())
+        self.ask_depth = float(self.ask_sizes.sum())
+
+    def _asks_cumulative(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._ask_cum is None:
+            self._ask_cum = _cumulative(self.ask_prices, self.ask_sizes)
+        return self._ask_cum
+
+    def _bids_cumulative(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._bid_cum is None:
+            self._bid_cum = _cumulative(self.bid_prices, self.bid_sizes)
+        return self._bid_cum
+
+    def fill_depth(self, side: str) -> tuple[np.ndarray, np.ndarray]:
+        """(prices, cumulative sizes), best first, for side "ask" or "bid"."""
+        if side == "ask":
+            return self.ask_prices, self._asks_cumulative()[0]
+        return self.bid_prices, self._bids_cumulative()[0]
 
     def vwap_buy(self, size: float) -> Optional[float]:
         """Volume-weighted average price to buy given size."""
-        remaining = size
-        cost = 0.0
-        for price, ask_size in sorted(self.asks):
-            fill = min(remaining, ask_size)
-            cost += price * fill
-            remaining -= fill
-            if remaining <= 0:
-                break
-        if remaining > 0:
-            return None  # Insufficient liquidity
-        return cost / size if size > 0 else 0.0
+        return _vwap(self.ask_prices, *self._asks_cumulative(), size)
 
     def vwap_sell(self, size: float) -> Optional[float]:
         """Volume-weighted average price to sell given size."""
-        remaining = size
-        revenue = 0.0
-        for price, bid_size in sorted(self.bids, reverse=True):
-            fill = min(remaining, bid_size)
-            revenue += price * fill
-            remaining -= fill
-            if remaining <= 0:
-                break
-        if remaining > 0:
-            return None
-        return revenue / size if size > 0 else 0.0
+        return _vwap(self.bid_prices, *self._bids_cumulative(), size)
 
     def best_bid(self) -> Optional[float]:
-        return max((p for p, _ in self.bids), default=None)
+        return self.best_bid_price
 
     def best_ask(self) -> Optional[float]:
-        return min((p for p, _ in self.asks), default=None)
+        return self.best_ask_price
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
     """Polymarket market with condition prices and order books."""
     id: str
@@ -90,11 +171,25 @@ class Market:
     event_slug: str  # Event slug for /event/{event_slug} URLs (multi-market events)
     condition_id: str
     outcomes: list[str]
-    outcome_prices: list[float]
+    outcome_prices: list[float]  # Parsed to floats by GammaClient
     clob_token_ids: list[str]
     order_book_yes: Optional[OrderBook] = None
     order_book_no: Optional[OrderBook] = None
     end_date: str = ""  # Resolution/expiration date (ISO), for filtering
+    # Memoized prices; order-book prices are keyed on the book objects they came from
+    _cached_gamma_prices: Optional[ConditionPrices] = field(default=None, init=False, repr=False, compare=False)
+    _cached_ob_prices: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    # Two outcomes, two prices and two token ids; checked once so price lookups needn't
+    is_binary: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.is_binary = (
+            len(self.outcomes) >= 2
+            and len(self.outcome_prices) >= 2
+            and len(self.clob_token_ids) >= 2
+            and bool(self.clob_token_ids[0])
+            and bool(self.clob_token_ids[1])
+        )
 
     def get_prices(self) -> Optional[ConditionPrices]:
         """Build ConditionPrices from Gamma outcome data."""
@@ -102,46 +197,57 @@ class Market:
 
     def _gamma_prices(self) -> Optional[ConditionPrices]:
         """Prices from Gamma API outcomePrices."""
-        if len(self.outcomes) < 2 or len(self.outcome_prices) < 2 or len(self.clob_token_ids) < 2:
+        if self._cached_gamma_prices is not None:
+            return self._cached_gamma_prices
+        if not self.is_binary:
             return None
-        return ConditionPrices(
+        self._cached_gamma_prices = ConditionPrices(
             token_id_yes=self.clob_token_ids[0],
             token_id_no=self.clob_token_ids[1],
-            price_yes=float(self.outcome_prices[0]),
-            price_no=float(self.outcome_prices[1]),
+            price_yes=self.outcome_prices[0],
+            price_no=self.outcome_prices[1],
             outcome_yes=self.outcomes[0],
             outcome_no=self.outcomes[1],
         )
+        return self._cached_gamma_prices
 
-    def get_order_book_prices(self) -> Optional[dict[str, ConditionPrices]]:
+    def get_order_book_prices(self) -> Optional[BuySellPrices]:
         """
         Tradeable prices from order books when available.
-        Returns {"buy": ConditionPrices (best ask), "sell": ConditionPrices (best bid)}
+        Returns BuySellPrices(buy=best asks, sell=best bids)
         or None if order books missing/incomplete.
         """
-        if not self.order_book_yes or not self.order_book_no:
+        if not self.is_binary or not self.order_book_yes or not self.order_book_no:
             return None
-        best_ask_yes = self.order_book_yes.best_ask()
-        best_ask_no = self.order_book_no.best_ask()
-        best_bid_yes = self.order_book_yes.best_bid()
-        best_bid_no = self.order_book_no.best_bid()
+        cached = self._cached_ob_prices
+        if cached is not None and cached[0] is self.order_book_yes and cached[1] is self.order_book_no:
+            return cached[2]
+        prices = self._order_book_prices()
+        self._cached_ob_prices = (self.order_book_yes, self.order_book_no, prices)
+        return prices
+
+    def _order_book_prices(self) -> Optional[BuySellPrices]:
+        best_ask_yes = self.order_book_yes.best_ask_price
+        best_ask_no = self.order_book_no.best_ask_price
+        best_bid_yes = self.order_book_yes.best_bid_price
+        best_bid_no = self.order_book_no.best_bid_price
         if best_ask_yes is None or best_ask_no is None or best_bid_yes is None or best_bid_no is None:
             return None
-        return {
-            "buy": ConditionPrices(
+        return BuySellPrices(
+            buy=ConditionPrices(
                 token_id_yes=self.clob_token_ids[0],
                 token_id_no=self.clob_token_ids[1],
                 price_yes=best_ask_yes,
                 price_no=best_ask_no,
-                outcome_yes=self.outcomes[0] if self.outcomes else "Yes",
-                outcome_no=self.outcomes[1] if len(self.outcomes) > 1 else "No",
+                outcome_yes=self.outcomes[0],
+                outcome_no=self.outcomes[1],
             ),
-            "sell": ConditionPrices(
+            sell=ConditionPrices(
                 token_id_yes=self.clob_token_ids[0],
                 token_id_no=self.clob_token_ids[1],
                 price_yes=best_bid_yes,
                 price_no=best_bid_no,
-                outcome_yes=self.outcomes[0] if self.outcomes else "Yes",
-                outcome_no=self.outcomes[1] if len(self.outcomes) > 1 else "No",
+                outcome_yes=self.outcomes[0],
+                outcome_no=self.outcomes[1],
             ),
-        }
+        )
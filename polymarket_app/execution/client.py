@@ -4,8 +4,11 @@ Execution client for placing arbitrage trades on Polymarket.
 Uses py-clob-client to submit buy/sell orders. Requires wallet setup and API credentials.
 """
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
@@ -20,6 +23,15 @@ class ExecutionResult:
     dry_run: bool
 
 
+def _extract_oid(resp) -> Optional[str]:
+    """Order ID from a post_order response, which may be a dict or an object."""
+    if isinstance(resp, dict):
+        oid = resp.get("orderID") or resp.get("order_id")
+    else:
+        oid = getattr(resp, "orderID", None) or getattr(resp, "order_id", None)
+    return str(oid) if oid else None
+
+
 class ExecutionClient:
     def __init__(
         self,
@@ -31,6 +43,7 @@ class ExecutionClient:
         api_key: Optional[str] = None,
         api_secret: Optional[str] = None,
         api_passphrase: Optional[str] = None,
+        creds_cache_dir: Optional[str] = None,
     ):
         self.private_key = private_key
         self.funder = funder
@@ -40,6 +53,9 @@ class ExecutionClient:
         self._api_key = api_key
         self._api_secret = api_secret
         self._api_passphrase = api_passphrase
+        # Opt-in: derived API creds (incl. the secret) are stored here in plain text
+        self.creds_cache_dir = creds_cache_dir
+        self._creds_cached = False  # Current client uses creds read from the cache
         self._client = None
 
     @classmethod
@@ -56,6 +72,7 @@ class ExecutionClient:
             api_key=os.environ.get("POLYMARKET_API_KEY"),
             api_secret=os.environ.get("POLYMARKET_API_SECRET"),
             api_passphrase=os.environ.get("POLYMARKET_API_PASSPHRASE"),
+            creds_cache_dir=os.environ.get("POLYMARKET_CREDS_DIR"),
         )
 
     def _get_client(self):
@@ -81,10 +98,57 @@ class ExecutionClient:
             )
             client.set_api_creds(creds)
         else:
-            client.set_api_creds(client.create_or_derive_api_creds())
+            client.set_api_creds(self._load_or_derive_creds(client))
         self._client = client
         return self._client
 
+    def _creds_path(self, client) -> Optional[Path]:
+        if not self.creds_cache_dir:
+            return None
+        # Derived creds belong to the signing key, so key on signer as well as funder
+        name = f"creds-{self.chain_id}-{client.get_address().lower()}-{self.funder.lower()}.json"
+        return Path(self.creds_cache_dir).expanduser() / name
+
+    def _load_or_derive_creds(self, client):
+        """Derive API creds, reusing them from creds_cache_dir across cold starts when set."""
+        from py_clob_client.clob_types import ApiCreds
+        path = self._creds_path(client)
+        self._creds_cached = False
+        if path is not None:
+            try:
+                creds = ApiCreds(**json.loads(path.read_text()))
+                self._creds_cached = True
+                return creds
+            except (OSError, ValueError, TypeError):
+                pass
+        creds = client.create_or_derive_api_creds()
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                os.fchmod(fd, 0o600)  # O_CREAT's mode doesn't apply to an existing file
+                with os.fdopen(fd, "w") as f:
+                    json.dump(
+                        {
+                            "api_key": creds.api_key,
+                            "api_secret": creds.api_secret,
+                            "api_passphrase": creds.api_passphrase,
+                        },
+                        f,
+                    )
+            except OSError:
+                pass  # Caching is best-effort; the derived creds are still usable
+        return creds
+
+    def _drop_cached_creds(self) -> None:
+        """Forget cached creds the server rejected; the next order re-derives them."""
+        try:
+            self._creds_path(self._client).unlink()
+        except OSError:
+            pass
+        self._client = None
+        self._creds_cached = False
+
     def execute_buy_both(
         self,
         opportunity: "ArbitrageOpportunity",
@@ -124,37 +188,51 @@ class ExecutionClient:
         return self._place_sell_both_orders(opportunity, size)
 
     def _place_buy_both_orders(self, opportunity: "ArbitrageOpportunity", size: float) -> ExecutionResult:
-        from py_clob_client.clob_types import OrderArgs
-        client = self._get_client()
-        order_ids = []
-        try:
-            for token_id, price, side in [
-                (opportunity.token_id_yes, opportunity.price_yes, "BUY"),
-                (opportunity.token_id_no, opportunity.price_no, "BUY"),
-            ]:
-                order_args = OrderArgs(token_id=token_id, price=price, size=size, side=side)
-                resp = client.create_and_post_order(order_args)
-                oid = resp.get("orderID", resp.get("order_id")) if isinstance(resp, dict) else getattr(resp, "orderID", getattr(resp, "order_id", None))
-                if oid:
-                    order_ids.append(str(oid))
-        except Exception as e:
-            return ExecutionResult(success=False, order_ids=order_ids, message=str(e), dry_run=False)
+        order_ids, error = self._place_both_legs(opportunity, size, "BUY")
+        if error is not None:
+            return ExecutionResult(success=False, order_ids=order_ids, message=str(error), dry_run=False)
         return ExecutionResult(success=True, order_ids=order_ids, message=f"Placed {len(order_ids)} orders", dry_run=False)
 
     def _place_sell_both_orders(self, opportunity: "ArbitrageOpportunity", size: float) -> ExecutionResult:
+        order_ids, error = self._place_both_legs(opportunity, size, "SELL")
+        if error is not None:
+            return ExecutionResult(success=False, order_ids=order_ids, message=str(error), dry_run=False)
+        return ExecutionResult(success=True, order_ids=order_ids, message=f"Placed {len(order_ids)} sell orders", dry_run=False)
+
+    def _place_both_legs(
+        self,
+        opportunity: "ArbitrageOpportunity",
+        size: float,
+        side: str,
+    ) -> tuple[list[str], Optional[Exception]]:
+        """
+        Sign both legs up front, then post them concurrently so leg 2 doesn't wait
+        on leg 1's round trip. Order IDs come back in YES, NO order.
+        """
         from py_clob_client.clob_types import OrderArgs
         client = self._get_client()
-        order_ids = []
         try:
-            for token_id, price, side in [
-                (opportunity.token_id_yes, opportunity.price_yes, "SELL"),
-                (opportunity.token_id_no, opportunity.price_no, "SELL"),
-            ]:
-                order_args = OrderArgs(token_id=token_id, price=price, size=size, side=side)
-                resp = client.create_and_post_order(order_args)
-                oid = resp.get("orderID", resp.get("order_id")) if isinstance(resp, dict) else getattr(resp, "orderID", getattr(resp, "order_id", None))
-                if oid:
-                    order_ids.append(str(oid))
+            order_yes = client.create_order(
+                OrderArgs(token_id=opportunity.token_id_yes, price=opportunity.price_yes, size=size, side=side)
+            )
+            order_no = client.create_order(
+                OrderArgs(token_id=opportunity.token_id_no, price=opportunity.price_no, size=size, side=side)
+            )
         except Exception as e:
-            return ExecutionResult(success=False, order_ids=order_ids, message=str(e), dry_run=False)
-        return ExecutionResult(success=True, order_ids=order_ids, message=f"Placed {len(order_ids)} sell orders", dry_run=False)
\ No newline at end of file
+            return [], e
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fut_yes = pool.submit(client.post_order, order_yes)
+            fut_no = pool.submit(client.post_order, order_no)
+        order_ids = []
+        error = None
+        for fut in (fut_yes, fut_no):
+            try:
+                oid = _extract_oid(fut.result())
+            except Exception as e:
+                error = error or e
+                continue
+            if oid:
+                order_ids.append(oid)
+        if self._creds_cached and getattr(error, "status_code", None) in (401, 403):
+            self._drop_cached_creds()
+        return order_ids, error
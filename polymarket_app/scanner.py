@@ -5,50 +5,110 @@ Fetches active markets, enriches with order books, and reports opportunities.
 """
 
 import asyncio
+import contextlib
+import heapq
+
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 
-from .config import MIN_PROFIT_THRESHOLD
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:  # aiolimiter is optional; the semaphore still bounds concurrency
+    AsyncLimiter = None
+
+from .config import CLOB_MAX_CONCURRENCY, CLOB_MAX_REQUESTS_PER_SECOND, MIN_PROFIT_THRESHOLD
 from .data import GammaClient, ClobClient
 from .data.models import Market
-from .arbitrage import detect_single_condition_arbitrage
-
-
-async def run_scan(limit: int = 50, min_profit: float = MIN_PROFIT_THRESHOLD) -> None:
-    """Fetch markets, enrich with order books, detect arbitrage."""
-    gamma = GammaClient()
-    clob = ClobClient()
+from .arbitrage import detect_single_condition_arbitrage_batch, market_price_arrays
+
+_TABLE_ROWS = 20  # Opportunities shown, best profit first
+
+
+async def run_scan(
+    limit: int = 50,
+    min_profit: float = MIN_PROFIT_THRESHOLD,
+    prefilter: bool = False,
+) -> None:
+    """
+    Fetch markets, enrich with order books, detect arbitrage.
+
+    prefilter: only fetch books for markets whose Gamma prices already miss
+    $1 by more than min_profit. Gamma prices are normalized mids that usually
+    sum to ~1, so this skips most of the network phase but also misses
+    arbitrage that exists only in the order book.
+    """
+    # Shared clients stay open for later scans on this loop; whoever owns the loop closes them
+    gamma = GammaClient.instance()
+    clob = ClobClient.instance()
     console = Console()
 
     console.print("[bold]Polymarket Arbitrage Scanner[/bold]")
     console.print(f"Fetching up to {limit} active markets...")
 
     markets = await gamma.fetch_active_markets(limit=limit)
-    binary = [
-        m
-        for m in markets
-        if len(m.clob_token_ids) >= 2
-        and m.clob_token_ids[0]
-        and m.clob_token_ids[1]
-    ]
+    binary = [m for m in markets if m.is_binary]
     console.print(f"Found {len(binary)} binary markets with token IDs")
 
-    for m in binary:
+    if prefilter:
+        py, pn, _, _ = market_price_arrays(binary, use_order_book=False)
+        keep = np.abs(py + pn - 1.0) > min_profit
+        binary = [m for m, k in zip(binary, keep.tolist()) if k]
+        console.print(f"{len(binary)} markets pass the Gamma price prefilter")
+
+    sem = asyncio.Semaphore(CLOB_MAX_CONCURRENCY)
+    # Token bucket: waits only once the per-second budget is spent
+    limiter = (
+        AsyncLimiter(CLOB_MAX_REQUESTS_PER_SECOND, time_period=1)
+        if AsyncLimiter is not None
+        else contextlib.nullcontext()
+    )
+
+    async def fetch_book(token_id: str):
+        async with sem, limiter:
+            return await clob.get_order_book(token_id)
+
+    async def fetch_pair(m: Market) -> Market:
         try:
-            ob_yes = await clob.get_order_book(m.clob_token_ids[0])
-            ob_no = await clob.get_order_book(m.clob_token_ids[1])
-            m.order_book_yes = ob_yes
-            m.order_book_no = ob_no
+            m.order_book_yes, m.order_book_no = await asyncio.gather(
+                fetch_book(m.clob_token_ids[0]),
+                fetch_book(m.clob_token_ids[1]),
+            )
         except Exception:
-            pass
-        await asyncio.sleep(0.1)
-
-    opportunities = []
-    for m in binary:
-        opps = detect_single_condition_arbitrage(m, min_profit=min_profit)
-        opportunities.extend(opps)
-
-    if not opportunities:
+            pass  # Failed fetches leave the market without books, as before
+        return m
+
+    # Screen markets in vectorized batches as their pairs land, so arbitrage math
+    # overlaps in-flight requests, and drop books that yield nothing to keep the
+    # working set small. Only the top rows are kept, in a min-heap keyed on profit.
+    top: list = []
+    total_opps = 0
+
+    def screen(arrived: list[Market]) -> None:
+        nonlocal total_opps
+        opps = detect_single_condition_arbitrage_batch(
+            arrived, *market_price_arrays(arrived), min_profit=min_profit
+        )
+        hit = {o.market_id for o in opps}
+        for m in arrived:
+            if m.id not in hit:
+                m.order_book_yes = m.order_book_no = None
+        for o in opps:
+            entry = (o.profit_margin, total_opps, o)  # Counter breaks ties before comparing opps
+            total_opps += 1
+            if len(top) < _TABLE_ROWS:
+                heapq.heappush(top, entry)
+            else:
+                heapq.heappushpop(top, entry)
+
+    # Screen whatever has arrived each time the loop wakes us, so screening
+    # overlaps the remaining fetches and missed books are released early
+    pending = {asyncio.ensure_future(fetch_pair(m)) for m in binary}
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        screen([t.result() for t in done])
+
+    if not total_opps:
         console.print("[yellow]No arbitrage opportunities exceeding threshold.[/yellow]")
         return
 
@@ -61,7 +121,7 @@ async def run_scan(limit: int = 50, min_profit: float = MIN_PROFIT_THRESHOLD) ->
     table.add_column("Profit %", justify="right")
     table.add_column("Max USD", justify="right")
 
-    for o in opportunities[:20]:
+    for _, _, o in sorted(top, reverse=True):
         max_usd = o.max_extractable_usd()
         max_str = f"${max_usd:.2f}" if max_usd is not None else "—"
         table.add_row(
@@ -75,13 +135,23 @@ async def run_scan(limit: int = 50, min_profit: float = MIN_PROFIT_THRESHOLD) ->
         )
 
     console.print(table)
-    console.print(f"\n[green]Total: {len(opportunities)} opportunities[/green]")
+    console.print(f"\n[green]Total: {total_opps} opportunities[/green]")
+
+
+async def _scan_once(**kwargs) -> None:
+    """run_scan, then close the shared clients before asyncio.run tears down the loop."""
+    try:
+        await run_scan(**kwargs)
+    finally:
+        await GammaClient.instance().aclose()
+        await ClobClient.instance().aclose()
 
 
 def main() -> None:
     import sys
-    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 30
-    asyncio.run(run_scan(limit=limit))
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    limit = int(args[0]) if args else 30
+    asyncio.run(_scan_once(limit=limit, prefilter="--prefilter" in sys.argv))
 
 
 if __name__ == "__main__":